@@ -13,8 +13,6 @@
 # limitations under the License.
 # ==============================================================================
 
-from collections import OrderedDict
-
 from tensorforce import TensorforceError
 from tensorforce.agents import TensorforceAgent
 
@@ -178,7 +176,7 @@ class AdvantageActorCritic(TensorforceAgent):
                 name='A2C', argument='critic_network', replacement='critic'
             )
 
-        self.spec = OrderedDict(
+        self.spec = dict(
             agent='a2c',
             states=states, actions=actions, batch_size=batch_size,
             max_episode_timesteps=max_episode_timesteps,
@@ -13,8 +13,6 @@
 # limitations under the License.
 # ==============================================================================
 
-from collections import OrderedDict
-
 from tensorforce import TensorforceError
 from tensorforce.agents import TensorforceAgent
 
@@ -173,7 +171,7 @@ class ActorCritic(TensorforceAgent):
                 name='AC', argument='critic_network', replacement='critic'
             )
 
-        self.spec = OrderedDict(
+        self.spec = dict(
             agent='ac',
             states=states, actions=actions, batch_size=batch_size,
             max_episode_timesteps=max_episode_timesteps,
@@ -292,6 +292,7 @@ class Agent(Recorder):
         # Parallel observe buffers
         self.terminal_buffer = [list() for _ in range(self.parallel_interactions)]
         self.reward_buffer = [list() for _ in range(self.parallel_interactions)]
+        self._num_buffered = 0
 
         # Store agent spec as JSON
         if self.model.saver is not None:
@@ -341,6 +342,7 @@ class Agent(Recorder):
             buffer.clear()
         for buffer in self.reward_buffer:
             buffer.clear()
+        self._num_buffered = 0
 
         # Reset model
         timesteps, episodes, updates = self.model.reset()
@@ -527,6 +529,7 @@ class Agent(Recorder):
             # Buffer inputs
             self.terminal_buffer[p].append(t)
             self.reward_buffer[p].append(r)
+            self._num_buffered += 1
 
             # Continue if not terminal and buffer_observe
             if t == 0 and (
@@ -538,6 +541,7 @@ class Agent(Recorder):
             # Buffered terminal/reward inputs
             ts = np.asarray(self.terminal_buffer[p], dtype=self.terminal_spec.np_type())
             rs = np.asarray(self.reward_buffer[p], dtype=self.reward_spec.np_type())
+            self._num_buffered -= len(self.terminal_buffer[p])
             self.terminal_buffer[p].clear()
             self.reward_buffer[p].clear()
 
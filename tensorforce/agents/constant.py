@@ -13,8 +13,6 @@
 # limitations under the License.
 # ==============================================================================
 
-from collections import OrderedDict
-
 from tensorforce.agents import Agent
 from tensorforce.core.models import ConstantModel
 
@@ -114,7 +112,7 @@ class ConstantAgent(Agent):
         config=None, recorder=None
     ):
         if not hasattr(self, 'spec'):
-            self.spec = OrderedDict(
+            self.spec = dict(
                 agent='constant',
                 states=states, actions=actions, max_episode_timesteps=max_episode_timesteps,
                 action_values=action_values,
@@ -13,8 +13,6 @@
 # limitations under the License.
 # ==============================================================================
 
-from collections import OrderedDict
-
 from tensorforce import TensorforceError
 from tensorforce.agents import TensorforceAgent
 
@@ -174,7 +172,7 @@ class DeterministicPolicyGradient(TensorforceAgent):
                 name='DPG', argument='critic_network', replacement='critic'
             )
 
-        self.spec = OrderedDict(
+        self.spec = dict(
             agent='dpg',
             states=states, actions=actions, memory=memory, batch_size=batch_size,
             max_episode_timesteps=max_episode_timesteps,
@@ -13,8 +13,6 @@
 # limitations under the License.
 # ==============================================================================
 
-from collections import OrderedDict
-
 from tensorforce import TensorforceError
 from tensorforce.agents import TensorforceAgent
 
@@ -168,7 +166,7 @@ class DeepQNetwork(TensorforceAgent):
                 name='DQN', argument='estimate_terminal', replacement='predict_terminal_values'
             )
 
-        self.spec = OrderedDict(
+        self.spec = dict(
             agent='dqn',
             states=states, actions=actions, memory=memory, batch_size=batch_size,
             max_episode_timesteps=max_episode_timesteps,
@@ -13,8 +13,6 @@
 # limitations under the License.
 # ==============================================================================
 
-from collections import OrderedDict
-
 from tensorforce import TensorforceError
 from tensorforce.agents import TensorforceAgent
 
@@ -198,7 +196,7 @@ class ProximalPolicyOptimization(TensorforceAgent):
                 name='PPO', argument='critic_optimizer', replacement='baseline_optimizer'
             )
 
-        self.spec = OrderedDict(
+        self.spec = dict(
             agent='ppo',
             states=states, actions=actions, max_episode_timesteps=max_episode_timesteps,
             batch_size=batch_size,
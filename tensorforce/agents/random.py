@@ -13,8 +13,6 @@
 # limitations under the License.
 # ==============================================================================
 
-from collections import OrderedDict
-
 from tensorforce.agents import Agent
 from tensorforce.core.models import RandomModel
 
@@ -108,7 +106,7 @@ class RandomAgent(Agent):
         config=None, recorder=None
     ):
         if not hasattr(self, 'spec'):
-            self.spec = OrderedDict(
+            self.spec = dict(
                 agent='random',
                 states=states, actions=actions, max_episode_timesteps=max_episode_timesteps,
                 config=config, recorder=recorder
@@ -189,10 +189,7 @@ class Recorder(object):
                         name='Agent.act', argument='internals', dtype=type(internals),
                         hint='is not tuple/list'
                     )
-                internals = [ArrayDict(internal) for internal in internals]
-                internals = internals[0].fmap(
-                    function=(lambda *xs: np.stack(xs, axis=0)), zip_values=internals[1:]
-                )
+                internals = ArrayDict(self._stack_iter_of_dicts(values=internals))
 
             else:
                 # Input structure dict[iter[internal]]
@@ -460,9 +457,8 @@ class Recorder(object):
                 directory = self.recorder['directory']
                 if os.path.isdir(directory):
                     files = sorted(
-                        f for f in os.listdir(directory)
-                        if os.path.isfile(os.path.join(directory, f))
-                        and os.path.splitext(f)[1] == '.npz'
+                        entry.name for entry in os.scandir(directory)
+                        if entry.is_file() and os.path.splitext(entry.name)[1] == '.npz'
                     )
                 else:
                     os.makedirs(directory)
@@ -528,10 +524,7 @@ class Recorder(object):
                     )
             # Turn iter of dicts into dict of arrays
             # (Doesn't use self.states_spec since states also contains auxiliaries)
-            states = [ArrayDict(state) for state in states]
-            states = states[0].fmap(
-                function=(lambda *xs: np.stack(xs, axis=0)), zip_values=states[1:]
-            )
+            states = ArrayDict(self._stack_iter_of_dicts(values=states))
 
         elif isinstance(states, dict):
             # States is dict, turn into arrays
@@ -573,3 +566,13 @@ class Recorder(object):
             )
 
         return states, batched, num_instances, is_iter_of_dicts
+
+    def _stack_iter_of_dicts(self, values):
+        # Stack per key in a single pass over the (possibly nested) dicts
+        if isinstance(values[0], dict):
+            return OrderedDict(
+                (name, self._stack_iter_of_dicts(values=[value[name] for value in values]))
+                for name in values[0]
+            )
+        else:
+            return np.stack(values, axis=0)
@@ -13,9 +13,8 @@
 # limitations under the License.
 # ==============================================================================
 
-from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import os
-from random import shuffle
 
 import numpy as np
 
@@ -354,7 +353,7 @@ class TensorforceAgent(Agent):
             raise TensorforceError.invalid(name='Agent', argument=', '.join(kwargs))
 
         if not hasattr(self, 'spec'):
-            self.spec = OrderedDict(
+            self.spec = dict(
                 agent='tensorforce',
                 # Environment
                 states=states, actions=actions, max_episode_timesteps=max_episode_timesteps,
@@ -383,10 +382,9 @@ class TensorforceAgent(Agent):
         if isinstance(update, int):
             update = dict(unit='timesteps', batch_size=update)
 
+        # Config is only copied if modified, to leave the given dict untouched
         if config is None:
             config = dict()
-        else:
-            config = dict(config)
 
         # TODO: should this change if summarizer is specified?
         if parallel_interactions > 1:
@@ -396,7 +394,7 @@ class TensorforceAgent(Agent):
                         name='Agent', argument='max_episode_timesteps',
                         condition='parallel_interactions > 1'
                     )
-                config['buffer_observe'] = 'episode'
+                config = dict(config, buffer_observe='episode')
             # elif config['buffer_observe'] < max_episode_timesteps:
             #     raise TensorforceError.value(
             #         name='Agent', argument='config[buffer_observe]',
@@ -407,9 +405,9 @@ class TensorforceAgent(Agent):
             update_frequency = update.get('frequency', update['batch_size'])
             if 'buffer_observe' not in config:
                 if isinstance(update_frequency, int):
-                    config['buffer_observe'] = update_frequency
+                    config = dict(config, buffer_observe=update_frequency)
                 else:
-                    config['buffer_observe'] = 1
+                    config = dict(config, buffer_observe=1)
             elif isinstance(update_frequency, int) and (
                 config['buffer_observe'] == 'episode' or config['buffer_observe'] > update_frequency
             ):
@@ -420,7 +418,7 @@ class TensorforceAgent(Agent):
 
         elif update['unit'] == 'episodes':
             if 'buffer_observe' not in config:
-                config['buffer_observe'] = 'episode'
+                config = dict(config, buffer_observe='episode')
 
         # reward_estimation = dict(reward_estimation)
         # if reward_estimation['horizon'] == 'episode':
@@ -436,6 +434,13 @@ class TensorforceAgent(Agent):
             parallel_interactions=parallel_interactions, config=config, recorder=recorder
         )
 
+        # Default all-true action masks for experience(), grown on demand
+        self._mask_cache = dict()
+
+        # Terminal/reward input dtypes for experience()
+        self._terminal_np_type = self.terminal_spec.np_type()
+        self._reward_np_type = self.reward_spec.np_type()
+
         self.model = TensorforceModel(
             states=self.states_spec, actions=self.actions_spec,
             max_episode_timesteps=self.max_episode_timesteps,
@@ -470,7 +475,7 @@ class TensorforceAgent(Agent):
             internals (dict[state]): Dictionary containing arrays of internal agent states
                 (<span style="color:#C00000"><b>required</b></span> if agent has internal states).
         """
-        if not all(len(buffer) == 0 for buffer in self.terminal_buffer):
+        if self._num_buffered > 0:
             raise TensorforceError(message="Calling agent.experience is not possible mid-episode.")
 
         # Process states input and infer batching structure
@@ -491,26 +496,7 @@ class TensorforceAgent(Agent):
                     hint='is not tuple/list'
                 )
             else:
-                internals = [ArrayDict(internal) for internal in internals]
-                internals = internals[0].fmap(
-                    function=(lambda *xs: np.stack(xs, axis=0)), zip_values=internals[1:]
-                )
-
-            # Actions
-            if isinstance(actions, np.ndarray):
-                actions = ArrayDict(singleton=actions)
-            elif not isinstance(actions, (tuple, list)):
-                raise TensorforceError.type(
-                    name='Agent.experience', argument='actions', dtype=type(actions),
-                    hint='is not tuple/list'
-                )
-            elif not isinstance(actions[0], dict):
-                actions = ArrayDict(singleton=np.asarray(actions))
-            else:
-                actions = [ArrayDict(action) for action in actions]
-                actions = actions[0].fmap(
-                    function=(lambda *xs: np.stack(xs, axis=0)), zip_values=actions[1:]
-                )
+                internals = ArrayDict(self._stack_iter_of_dicts(values=internals))
 
         else:
             # Input structure dict[iter[input]]
@@ -527,50 +513,33 @@ class TensorforceAgent(Agent):
             else:
                 internals = ArrayDict(internals)
 
-            # Actions
-            if not isinstance(actions, np.ndarray):
-                actions = ArrayDict(singleton=actions)
-            elif not isinstance(actions, dict):
-                raise TensorforceError.type(
-                    name='Agent.experience', argument='actions', dtype=type(actions),
-                    hint='is not dict'
-                )
-            else:
-                actions = ArrayDict(actions)
+        # Actions
+        actions = self._process_actions_input(actions=actions, is_iter_of_dicts=is_iter_of_dicts)
 
         # Expand inputs if not batched
         if not batched:
             internals = internals.fmap(function=(lambda x: np.expand_dims(x, axis=0)))
             actions = actions.fmap(function=(lambda x: np.expand_dims(x, axis=0)))
             terminal = np.asarray([terminal])
-            reward = np.asarray([reward])
+            reward = np.asarray([reward], dtype=self._reward_np_type)
         else:
             terminal = np.asarray(terminal)
-            reward = np.asarray(reward)
+            reward = np.asarray(reward, dtype=self._reward_np_type)
 
         # Check number of inputs
-        for name, internal in internals.items():
-            if internal.shape[0] != num_instances:
-                raise TensorforceError.value(
-                    name='Agent.experience', argument='len(internals[{}])'.format(name),
-                    value=internal.shape[0], hint='!= len(states)'
-                )
-        for name, action in actions.items():
-            if action.shape[0] != num_instances:
+        for argument, values in (('internals', internals), ('actions', actions)):
+            for name, value in values.items():
+                if value.shape[0] != num_instances:
+                    raise TensorforceError.value(
+                        name='Agent.experience', argument='len({}[{}])'.format(argument, name),
+                        value=value.shape[0], hint='!= len(states)'
+                    )
+        for argument, value in (('terminal', terminal), ('reward', reward)):
+            if value.shape[0] != num_instances:
                 raise TensorforceError.value(
-                    name='Agent.experience', argument='len(actions[{}])'.format(name),
-                    value=action.shape[0], hint='!= len(states)'
+                    name='Agent.experience', argument='len({})'.format(argument),
+                    value=value.shape[0], hint='!= len(states)'
                 )
-        if terminal.shape[0] != num_instances:
-            raise TensorforceError.value(
-                name='Agent.experience', argument='len(terminal)'.format(name),
-                value=terminal.shape[0], hint='!= len(states)'
-            )
-        if reward.shape[0] != num_instances:
-            raise TensorforceError.value(
-                name='Agent.experience', argument='len(reward)'.format(name),
-                value=reward.shape[0], hint='!= len(states)'
-            )
 
         def function(name, spec):
             auxiliary = ArrayDict()
@@ -579,9 +548,22 @@ class TensorforceAgent(Agent):
                 if name is None:
                     name = 'action'
                 # Mask, either part of states or default all true
-                auxiliary['mask'] = states.pop(name + '_mask', np.ones(
-                    shape=(num_instances,) + spec.shape + (spec.num_values,), dtype=spec.np_type()
-                ))
+                mask = states.pop(name + '_mask', None)
+                if mask is None:
+                    # Default masks are read-only, so slices of a cached buffer can be shared
+                    mask = self._mask_cache.get(name)
+                    if mask is None or mask.shape[0] < num_instances:
+                        size = num_instances
+                        if mask is not None:
+                            size = max(size, 2 * mask.shape[0])
+                        mask = np.ones(
+                            shape=((size,) + spec.shape + (spec.num_values,)),
+                            dtype=util.np_dtype(dtype='bool')
+                        )
+                        mask.flags.writeable = False
+                        self._mask_cache[name] = mask
+                    mask = mask[:num_instances]
+                auxiliary['mask'] = mask
             return auxiliary
 
         auxiliaries = self.actions_spec.fmap(function=function, cls=ArrayDict, with_names=True)
@@ -589,48 +571,37 @@ class TensorforceAgent(Agent):
             states[None] = states.pop('state')
 
         # Convert terminal to int if necessary
-        if terminal.dtype is util.np_dtype(dtype='bool'):
-            zeros = np.zeros_like(terminal, dtype=util.np_dtype(dtype='int'))
-            ones = np.ones_like(terminal, dtype=util.np_dtype(dtype='int'))
-            terminal = np.where(terminal, ones, zeros)
+        if terminal.dtype.kind == 'b':
+            terminal = terminal.astype(self._terminal_np_type)
 
         if terminal[-1] == 0:
             raise TensorforceError(message="Agent.experience() requires full episodes as input.")
 
         # Batch experiences split into episodes and at most size buffer_observe
         last = 0
-        for index in range(1, len(terminal) + 1):
-            if terminal[index - 1] == 0:
-                continue
-
-            function = (lambda x: x[last: index])
-            states_batch = states.fmap(function=function)
-            internals_batch = internals.fmap(function=function)
-            auxiliaries_batch = auxiliaries.fmap(function=function)
-            actions_batch = actions.fmap(function=function)
-            terminal_batch = function(terminal)
-            reward_batch = function(reward)
+        for index in (np.flatnonzero(terminal) + 1).tolist():
+            batch = slice(last, index)
             last = index
 
-            # Inputs to tensors
+            # Inputs to tensors, sliced to batch as part of conversion
             states_batch = self.states_spec.to_tensor(
-                value=states_batch, batched=True, name='Agent.experience states'
+                value=states, batched=True, index=batch, name='Agent.experience states'
             )
             internals_batch = self.internals_spec.to_tensor(
-                value=internals_batch, batched=True, recover_empty=True,
+                value=internals, batched=True, recover_empty=True, index=batch,
                 name='Agent.experience internals'
             )
             auxiliaries_batch = self.auxiliaries_spec.to_tensor(
-                value=auxiliaries_batch, batched=True, name='Agent.experience auxiliaries'
+                value=auxiliaries, batched=True, index=batch, name='Agent.experience auxiliaries'
             )
             actions_batch = self.actions_spec.to_tensor(
-                value=actions_batch, batched=True, name='Agent.experience actions'
+                value=actions, batched=True, index=batch, name='Agent.experience actions'
             )
             terminal_batch = self.terminal_spec.to_tensor(
-                value=terminal_batch, batched=True, name='Agent.experience terminal'
+                value=terminal, batched=True, index=batch, name='Agent.experience terminal'
             )
             reward_batch = self.reward_spec.to_tensor(
-                value=reward_batch, batched=True, name='Agent.experience reward'
+                value=reward, batched=True, index=batch, name='Agent.experience reward'
             )
 
             # Model.experience()
@@ -638,8 +609,10 @@ class TensorforceAgent(Agent):
                 states=states_batch, internals=internals_batch, auxiliaries=auxiliaries_batch,
                 actions=actions_batch, terminal=terminal_batch, reward=reward_batch
             )
-            self.timesteps = timesteps.numpy().item()
-            self.episodes = episodes.numpy().item()
+
+        # Counters only retrieved after the last batch, to avoid a device sync per batch
+        self.timesteps = timesteps.numpy().item()
+        self.episodes = episodes.numpy().item()
 
         if self.model.saver is not None:
             self.model.save()
@@ -692,33 +665,105 @@ class TensorforceAgent(Agent):
                 name='agent.pretrain', argument='directory', value=directory
             )
         files = sorted(
-            os.path.join(directory, f) for f in os.listdir(directory)
-            if os.path.isfile(os.path.join(directory, f)) and os.path.splitext(f)[1] == extension
+            entry.path for entry in os.scandir(directory)
+            if entry.is_file() and os.path.splitext(entry.name)[1] == extension
         )
-        indices = list(range(len(files)))
-
-        for _ in range(num_iterations):
-            shuffle(indices)
-            if num_traces is None:
-                selection = indices
-            else:
-                selection = indices[:num_traces]
 
-            batch = None
-            for index in selection:
-                trace = ArrayDict(np.load(files[index]))
-                if batch is None:
-                    batch = trace
+        def read_header(trace, name):
+            # Array shape and dtype from the .npy header, without decompressing the array
+            with trace.zip.open(name + '.npy') as member:
+                version = np.lib.format.read_magic(member)
+                if version == (1, 0):
+                    shape, _, dtype = np.lib.format.read_array_header_1_0(member)
                 else:
-                    batch = batch.fmap(
-                        function=(lambda x, y: np.concatenate([x, y], axis=0)), zip_values=(trace,)
+                    shape, _, dtype = np.lib.format.read_array_header_2_0(member)
+            return shape, dtype
+
+        def read_length(index):
+            with np.load(files[index]) as trace:
+                shape, _ = read_header(trace=trace, name='terminal')
+            return shape[0]
+
+        def copy_trace(index, start, arrays):
+            # Arrays are decompressed one at a time, straight into their batch slice
+            with np.load(files[index]) as trace:
+                for name in trace.files:
+                    value = trace[name]
+                    arrays[name][start: start + value.shape[0]] = value
+
+        # Batch buffers, reused across iterations and only reallocated if too small (consequently
+        # also kept alive during updates, although experience is stored in model memory)
+        buffers = dict()
+
+        # Traces are decompressed concurrently (zlib releases the GIL), each loader holding at most
+        # one decompressed array, so few loaders suffice and bound the memory overhead
+        if hasattr(os, 'sched_getaffinity'):
+            num_workers = len(os.sched_getaffinity(0))
+        else:
+            num_workers = os.cpu_count() or 1
+        num_workers = min(num_workers, 4, len(files) if num_traces is None else num_traces)
+        num_workers = max(num_workers, 1)
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            for _ in range(num_iterations):
+                # Random selection of traces (all if num_traces is None)
+                selection = np.random.permutation(len(files))[:num_traces]
+
+                # Trace lengths and array specs, only reading the array headers
+                lengths = [read_length(index) for index in selection]
+                num_timesteps = sum(lengths)
+                with np.load(files[selection[0]]) as trace:
+                    specs = dict(
+                        (name, read_header(trace=trace, name=name)) for name in trace.files
                     )
 
-            for name, value in batch.pop('auxiliaries', dict()).items():
-                assert name.endswith('/mask')
-                batch['states'][name[:-5] + '_mask'] = value
+                # Batch arrays as views of the (possibly larger) batch buffers
+                arrays = dict()
+                for name, (shape, dtype) in specs.items():
+                    buffer = buffers.get(name)
+                    if buffer is None or buffer.shape[0] < num_timesteps:
+                        buffer = np.empty(shape=((num_timesteps,) + shape[1:]), dtype=dtype)
+                        buffers[name] = buffer
+                    arrays[name] = buffer[:num_timesteps]
+
+                # Copy traces into disjoint batch slices, in parallel
+                starts = np.cumsum([0] + lengths[:-1]).tolist()
+                futures = [
+                    executor.submit(copy_trace, index, start, arrays)
+                    for index, start in zip(selection, starts)
+                ]
+                for future in futures:
+                    future.result()
+                batch = ArrayDict(arrays)
+
+                for name, value in batch.pop('auxiliaries', dict()).items():
+                    assert name.endswith('/mask')
+                    batch['states'][name[:-5] + '_mask'] = value
+
+                self.experience(**batch.to_kwargs())
+
+                for _ in range(num_updates):
+                    self.update()
+                # TODO: self.obliviate()
+
+    def _process_actions_input(self, actions, is_iter_of_dicts):
+        if is_iter_of_dicts:
+            # Input structure iter[dict[action]], or array/iter[action] if single action
+            if isinstance(actions, np.ndarray):
+                return ArrayDict(singleton=actions)
+            elif not isinstance(actions, (tuple, list)):
+                raise TensorforceError.type(
+                    name='Agent.experience', argument='actions', dtype=type(actions),
+                    hint='is not tuple/list'
+                )
+            elif not isinstance(actions[0], dict):
+                return ArrayDict(singleton=np.asarray(actions))
+            else:
+                return ArrayDict(self._stack_iter_of_dicts(values=actions))
+
+        elif isinstance(actions, dict):
+            # Input structure dict[iter[action]]
+            return ArrayDict(actions)
 
-            self.experience(**batch.to_kwargs())
-            for _ in range(num_updates):
-                self.update()
-            # TODO: self.obliviate()
+        else:
+            # Input structure array/iter[action] if single action
+            return ArrayDict(singleton=actions)
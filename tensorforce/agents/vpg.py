@@ -13,8 +13,6 @@
 # limitations under the License.
 # ==============================================================================
 
-from collections import OrderedDict
-
 from tensorforce import TensorforceError
 from tensorforce.agents import TensorforceAgent
 
@@ -175,7 +173,7 @@ class VanillaPolicyGradient(TensorforceAgent):
                 name='VPG', argument='baseline_network', replacement='baseline'
             )
 
-        self.spec = OrderedDict(
+        self.spec = dict(
             agent='vpg',
             states=states, actions=actions, max_episode_timesteps=max_episode_timesteps,
             batch_size=batch_size,
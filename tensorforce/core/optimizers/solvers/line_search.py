@@ -50,7 +50,8 @@ class LineSearch(Iterative):
                 deltas=self.values_spec.signature(batched=False),
                 improvement=TensorSpec(type='float', shape=()).signature(batched=False),
                 last_improvement=TensorSpec(type='float', shape=()).signature(batched=False),
-                base_value=TensorSpec(type='float', shape=()).signature(batched=False)
+                base_value=TensorSpec(type='float', shape=()).signature(batched=False),
+                backtracking_factor=TensorSpec(type='float', shape=()).signature(batched=False)
             )
 
         elif function == 'solve' or function == 'start':
@@ -80,7 +81,8 @@ class LineSearch(Iterative):
                 deltas=self.values_spec.signature(batched=False),
                 improvement=TensorSpec(type='float', shape=()).signature(batched=False),
                 last_improvement=TensorSpec(type='float', shape=()).signature(batched=False),
-                base_value=TensorSpec(type='float', shape=()).signature(batched=False)
+                base_value=TensorSpec(type='float', shape=()).signature(batched=False),
+                backtracking_factor=TensorSpec(type='float', shape=()).signature(batched=False)
             )
 
         else:
@@ -119,18 +121,26 @@ class LineSearch(Iterative):
             Initial arguments for step.
         """
         one_float = tf_util.constant(value=1.0, dtype='float')
+        # Retrieved once per solve, since value() may involve summaries/tracking/assertions
         backtracking_factor = self.backtracking_factor.value()
-        deltas = x_init.fmap(function=(lambda t: t * (backtracking_factor - one_float)))
+        factor = backtracking_factor - one_float
+        deltas = x_init.fmap(function=(lambda t: t * factor))
 
         last_improvement = base_value - zero_value
 
         target_value = self.fn_x(arguments, deltas)
         improvement = base_value - target_value
 
-        return arguments, x_init, deltas, improvement, last_improvement, base_value
+        return (
+            arguments, x_init, deltas, improvement, last_improvement, base_value,
+            backtracking_factor
+        )
 
-    @tf_function(num_args=6, is_loop_body=True)
-    def step(self, *, arguments, x, deltas, improvement, last_improvement, base_value):
+    @tf_function(num_args=7, is_loop_body=True)
+    def step(
+        self, *, arguments, x, deltas, improvement, last_improvement, base_value,
+        backtracking_factor
+    ):
         """
         Iteration loop body of the line search algorithm.
 
@@ -140,22 +150,28 @@ class LineSearch(Iterative):
             improvement: Current improvement $(f(x') - f(x_t))$.
             last_improvement: Last improvement $(f(x') - f(x_{t-1}))$.
             base_value: Value $f(x')$ at $x = x'$.
+            backtracking_factor: Backtracking factor.
 
         Returns:
             Updated arguments for next iteration.
         """
         next_x = x.fmap(function=(lambda t, delta: t + delta), zip_values=deltas)
 
-        backtracking_factor = self.backtracking_factor.value()
         next_deltas = deltas.fmap(function=(lambda delta: delta * backtracking_factor))
 
         target_value = self.fn_x(arguments, next_deltas)
         next_improvement = base_value - target_value
 
-        return arguments, next_x, next_deltas, next_improvement, improvement, base_value
+        return (
+            arguments, next_x, next_deltas, next_improvement, improvement, base_value,
+            backtracking_factor
+        )
 
-    @tf_function(num_args=6)
-    def next_step(self, *, arguments, x, deltas, improvement, last_improvement, base_value):
+    @tf_function(num_args=7)
+    def next_step(
+        self, *, arguments, x, deltas, improvement, last_improvement, base_value,
+        backtracking_factor
+    ):
         """
         Termination condition: max number of iterations, or no improvement for last step, or
         improvement less than acceptable ratio, or estimated value not positive.
@@ -166,14 +182,18 @@ class LineSearch(Iterative):
             improvement: Current improvement $(f(x') - f(x_t))$.
             last_improvement: Last improvement $(f(x') - f(x_{t-1}))$.
             base_value: Value $f(x')$ at $x = x'$.
+            backtracking_factor: Backtracking factor.
 
         Returns:
             True if another iteration should be performed.
         """
         return improvement > last_improvement
 
-    @tf_function(num_args=6)
-    def end(self, *, arguments, x, deltas, improvement, last_improvement, base_value):
+    @tf_function(num_args=7)
+    def end(
+        self, *, arguments, x, deltas, improvement, last_improvement, base_value,
+        backtracking_factor
+    ):
         """
         Termination step preparing the return value.
 
@@ -183,6 +203,7 @@ class LineSearch(Iterative):
             improvement: Current improvement $(f(x') - f(x_t))$.
             last_improvement: Last improvement $(f(x') - f(x_{t-1}))$.
             base_value: Value $f(x')$ at $x = x'$.
+            backtracking_factor: Backtracking factor.
 
         Returns:
             Final solution.
@@ -146,11 +146,17 @@ class TensorSpec(object):
         # TensorFlow TensorSpec
         return tf.TensorSpec(shape=tf.TensorShape(dims=shape), dtype=self.tf_type())
 
-    def to_tensor(self, *, value, batched, recover_empty=False, name='TensorSpec.to_tensor'):
+    def to_tensor(
+        self, *, value, batched, recover_empty=False, index=None, name='TensorSpec.to_tensor'
+    ):
         # Check whether underspecified
         if self.is_underspecified():
             raise TensorforceError.unexpected()
 
+        # Select batch subset before conversion, if index given
+        if index is not None:
+            value = np.asarray(a=value)[index]
+
         # Convert value to Numpy array, checks type
         value = np.asarray(a=value, dtype=self.np_type())
 
@@ -161,8 +167,8 @@ class TensorSpec(object):
                 hint='!= {}'.format(self.shape)
             )
 
-        # Check for nan or inf
-        if np.isnan(value).any() or np.isinf(value).any():
+        # Check for nan or inf (only possible for float)
+        if self.type == 'float' and not np.isfinite(value).all():
             raise TensorforceError.value(
                 name=name, argument='value', value=value, hint='contains nan/inf'
             )
@@ -211,8 +217,8 @@ class TensorSpec(object):
         # Convert tensor value to Numpy array
         value = tensor.numpy()
 
-        # Check for nan or inf
-        if np.isnan(value).any() or np.isinf(value).any():
+        # Check for nan or inf (only possible for float)
+        if self.type == 'float' and not np.isfinite(value).all():
             raise TensorforceError.value(
                 name=name, argument='tensor', value=value
             )
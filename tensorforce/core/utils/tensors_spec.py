@@ -27,7 +27,9 @@ class TensorsSpec(NestedDict):
     def signature(self, *, batched):
         return self.fmap(function=(lambda spec: spec.signature(batched=batched)), cls=SignatureDict)
 
-    def to_tensor(self, *, value, batched, recover_empty=False, name='TensorSpec.to_tensor'):
+    def to_tensor(
+        self, *, value, batched, recover_empty=False, index=None, name='TensorSpec.to_tensor'
+    ):
         if value is not None and not isinstance(value, ArrayDict):
             raise TensorforceError.type(name=name, argument='value', dtype=type(value))
 
@@ -40,11 +42,13 @@ class TensorsSpec(NestedDict):
             if recover_empty and name not in value:
                 assert not isinstance(spec, self.value_type) and len(spec) == 0
                 tensor[name] = spec.to_tensor(
-                    value=None, batched=batched, recover_empty=recover_empty, name=name
+                    value=None, batched=batched, recover_empty=recover_empty, index=index,
+                    name=name
                 )
             else:
                 tensor[name] = spec.to_tensor(
-                    value=value[name], batched=batched, recover_empty=recover_empty, name=name
+                    value=value[name], batched=batched, recover_empty=recover_empty, index=index,
+                    name=name
                 )
         return tensor
 
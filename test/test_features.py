@@ -41,3 +41,47 @@ class TestFeatures(UnittestBase, unittest.TestCase):
         )
         action = agent.act(states=states)
         assert action != 1
+
+    def test_experience_structures(self):
+        self.start_tests(name='experience-structures')
+
+        agent_spec = dict(
+            agent='tensorforce', max_episode_timesteps=10, memory=100,
+            policy=dict(network=dict(type='auto', size=8, depth=1, rnn=False)),
+            update=dict(unit='episodes', batch_size=1),
+            optimizer=dict(optimizer='adam', learning_rate=1e-3), objective='policy_gradient',
+            reward_estimation=dict(horizon=1), config=self.__class__.agent['config']
+        )
+        states = dict(state=np.random.random_sample(size=(5, 10)))
+        terminal = np.asarray([False, False, False, False, True])
+        reward = np.random.random_sample(size=(5,))
+
+        # Single action, given as array of actions
+        agent = Agent.create(
+            states=dict(type='float', shape=(10,)),
+            actions=dict(type='int', shape=(), num_values=3), **agent_spec
+        )
+        agent.experience(
+            states=states, actions=np.random.randint(3, size=(5,)), terminal=terminal,
+            reward=reward
+        )
+        agent.update()
+        agent.close()
+        self.finished_test()
+
+        # Multiple actions, given as dict of arrays of actions
+        agent = Agent.create(
+            states=dict(type='float', shape=(10,)), actions=dict(
+                int_action=dict(type='int', shape=(), num_values=3),
+                float_action=dict(type='float', shape=(2,))
+            ), **agent_spec
+        )
+        agent.experience(
+            states=states, actions=dict(
+                int_action=np.random.randint(3, size=(5,)),
+                float_action=np.random.random_sample(size=(5, 2))
+            ), terminal=terminal, reward=reward
+        )
+        agent.update()
+        agent.close()
+        self.finished_test()